@@ -4,68 +4,134 @@ Can generate both documentation diagrams and application code.
 """
 import os
 import re
+import asyncio
+from functools import lru_cache
+from typing import List
 from pydantic_ai import Agent, RunContext
-from .models import FileAction
+from .models import FileAction, FILE_ACTION_ADAPTER
 from .utils import user_input_tool
 
+# Karakter metacharacter regex; pattern tanpa satupun karakter ini adalah literal
+_REGEX_META = set(r".^$*+?{}[]|()\\")
+
+
+# Mapping nama flag (dari FileAction.flags) ke konstanta re
+_FLAG_MAP = {
+    "multiline": re.MULTILINE,
+    "dotall": re.DOTALL,
+    "ignorecase": re.IGNORECASE,
+}
+
+
+# Batas karakter yang dikembalikan tool read; isi file masuk ke prompt LLM
+# sehingga file sangat besar tidak boleh dimuat (dan dibayar) utuh
+_READ_PREVIEW_LIMIT = 1 << 20  # 1 MiB
+
+
+@lru_cache(maxsize=128)
+def _compile_edit(pattern, flags=re.MULTILINE):
+    """Compile pattern edit dengan cache, agar pattern berulang tidak dikompilasi ulang."""
+    return re.compile(pattern, flags)
+
 
 class FileManager:
     """Unified file manager for both Mermaid and code files."""
     
     def execute(self, action: FileAction):
+        if isinstance(action, dict):
+            # Validasi lewat adapter yang sudah dikompilasi, bukan membangun model baru
+            action = FILE_ACTION_ADAPTER.validate_python(action)
         if action.action == "create":
             return self._create(action.file_path, action.content)
         elif action.action == "read":
-            return self._read(action.file_path)
+            return self._read(action.file_path, limit=_READ_PREVIEW_LIMIT)
         elif action.action == "edit":
-            return self._edit(action.file_path, action.pattern, action.content)
+            return self._edit(action.file_path, action.pattern, action.content, action.flags)
         elif action.action == "delete":
             return self._delete(action.file_path)
         else:
             raise ValueError(f"Unsupported action: {action.action}")
 
+    async def execute_async(self, action: FileAction):
+        """Jalankan aksi file di worker thread agar tidak memblokir event loop."""
+        return await asyncio.to_thread(self.execute, action)
+
     def _create(self, path: str, content: str):
-        if not content:
+        if content is None:
             raise ValueError("Content cannot be empty for file creation")
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
         
+        content = content.strip()
         with open(path, "w", encoding="utf-8") as f:
-            f.write(content.strip() + "\n")
-        
+            # Dua write terpisah, tanpa alokasi string gabungan sebesar isi file
+            f.write(content)
+            f.write("\n")
+
         return f"File {path} created successfully."
 
-    def _read(self, path: str):
-        if not os.path.exists(path):
+    def _read(self, path: str, limit: int = None):
+        # EAFP: langsung open, tanpa stat terpisah (hindari TOCTOU + syscall ekstra)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if limit is None:
+                    return f.read()
+                # Baca terbatas: jangan materialisasi file raksasa sebagai satu string
+                content = f.read(limit)
+                if not f.read(1):
+                    return content
+                size = os.path.getsize(path)
+                return (
+                    f"{content}\n\n[File truncated: showing first {limit} characters "
+                    f"of {size} bytes. Use an edit action to modify later sections.]"
+                )
+        except FileNotFoundError:
             return f"File {path} not found."
-        
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
 
-    def _edit(self, path: str, pattern: str, replacement: str):
-        if not os.path.exists(path):
-            return f"File {path} not found for editing."
-        
+    def _edit(self, path: str, pattern: str, replacement: str, flag_names=None):
         if not pattern or not replacement:
             raise ValueError("Pattern and replacement must be provided for edit")
-        
-        text = self._read(path)
-        if isinstance(text, str) and "not found" in text:
-            return text
-        
-        new_text = re.sub(pattern, replacement, text, flags=re.MULTILINE | re.DOTALL)
-        
+
+        # Default hanya MULTILINE; DOTALL rawan backtracking patologis pada pattern
+        # agent seperti '.*' sehingga harus diminta eksplisit lewat flags
+        flags = re.MULTILINE
+        if flag_names:
+            flags = 0
+            for name in flag_names:
+                flags |= _FLAG_MAP.get(name.lower(), 0)
+
+        # EAFP langsung di sini: mendeteksi file hilang dari isi string _read
+        # salah tangkap jika konten file kebetulan memuat "not found"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return f"File {path} not found for editing."
+
+        # Fast-path hanya untuk pencocokan case-sensitive; str.replace tidak
+        # bisa menghormati flag ignorecase
+        if not (flags & re.IGNORECASE) and _REGEX_META.isdisjoint(pattern):
+            # Fast-path: pattern literal, str.replace jauh lebih murah daripada re.sub
+            if pattern not in text:
+                return f"File {path} unchanged (no matches)."
+            new_text = text.replace(pattern, replacement)
+        else:
+            new_text, n_subs = _compile_edit(pattern, flags).subn(replacement, text)
+            if n_subs == 0:
+                # Tidak ada yang berubah, jangan tulis ulang file besar sia-sia
+                return f"File {path} unchanged (no matches)."
+
         with open(path, "w", encoding="utf-8") as f:
             f.write(new_text)
-        
+
         return f"File {path} edited successfully."
 
     def _delete(self, path: str):
-        if not os.path.exists(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
             return f"File {path} not found for deletion."
-        
-        os.remove(path)
         return f"File {path} deleted successfully."
 
 
@@ -73,14 +139,25 @@ def create_generator_agent(model, memory_tools):
     """Create unified generator agent for Mermaid diagrams and code."""
     file_manager = FileManager()
     
-    def execute_file_action(ctx: RunContext, action: FileAction) -> str:
+    async def execute_file_action(ctx: RunContext, action: FileAction) -> str:
         """Execute file actions like create, read, edit, or delete files"""
         try:
-            result = file_manager.execute(action)
+            result = await file_manager.execute_async(action)
             return result
         except Exception as e:
             return f"Error executing action: {str(e)}"
-    
+
+    async def execute_file_actions(ctx: RunContext, actions: List[FileAction]) -> List[str]:
+        """Execute multiple file actions concurrently. Prefer this when emitting more than one file."""
+        results = await asyncio.gather(
+            *(file_manager.execute_async(a) for a in actions),
+            return_exceptions=True
+        )
+        return [
+            f"Error executing action: {r}" if isinstance(r, Exception) else r
+            for r in results
+        ]
+
     generator_prompt = """
     You are an expert generator that can create:
     1. **Mermaid Diagrams**: flowcharts, sequence diagrams, class diagrams, architecture diagrams, etc.
@@ -102,8 +179,9 @@ def create_generator_agent(model, memory_tools):
     **File Operations:**
     - action="create": Create new files with content
     - action="read": Read existing files
-    - action="edit": Edit files using regex patterns
+    - action="edit": Edit files using regex patterns (set flags=["dotall"] only when the match must cross lines)
     - action="delete": Delete files
+    - Use `execute_file_actions` with a list of actions when creating more than one file at once
 
     **Memory Access:**
     - Use `list_available_documents_tool` to see available documents
@@ -117,5 +195,5 @@ def create_generator_agent(model, memory_tools):
     return Agent(
         model=model,
         system_prompt=generator_prompt,
-        tools=[execute_file_action, user_input_tool] + memory_tools
+        tools=[execute_file_action, execute_file_actions, user_input_tool] + memory_tools
     )
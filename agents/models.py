@@ -2,8 +2,9 @@
 Simplified models for SSDLC agents.
 Contains streamlined Pydantic models for professional use.
 """
+from functools import cached_property
 from typing import List, Optional
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
 # ==================================================================================================
 # SIMPLIFIED MODEL DEFINITIONS
@@ -70,14 +71,15 @@ class ThreatRisk(BaseModel):
     affectedUsers: int = Field(..., ge=0, le=10)
     discoverability: int = Field(..., ge=0, le=10)
 
+    # cached_property: skor hanya dihitung sekali karena faktor risiko immutable
     @computed_field
-    @property
+    @cached_property
     def riskScore(self) -> float:
-        return (self.damage + self.reproducibility + self.exploitability + 
+        return (self.damage + self.reproducibility + self.exploitability +
                 self.affectedUsers + self.discoverability) / 5
 
     @computed_field
-    @property
+    @cached_property
     def riskLevel(self) -> str:
         if self.riskScore >= 8: return "Critical"
         elif self.riskScore >= 6: return "High"
@@ -100,5 +102,12 @@ class ThreatModel(BaseModel):
 class FileAction(BaseModel):
     action: str = Field(..., description="Action: create, read, edit, delete")
     file_path: str = Field(..., description="Path to file")
-    content: str = Field(None, description="File content for create/edit")
-    pattern: str = Field(None, description="Pattern for edit operations")
+    content: Optional[str] = Field(default=None, description="File content for create/edit")
+    pattern: Optional[str] = Field(default=None, description="Pattern for edit operations")
+    flags: Optional[List[str]] = Field(
+        default=None,
+        description="Regex flags for edit: 'multiline', 'dotall', 'ignorecase' (default: multiline only)"
+    )
+
+# Validator FileAction yang dibangun sekali saat import, bukan per pemanggilan
+FILE_ACTION_ADAPTER = TypeAdapter(FileAction)
@@ -7,74 +7,109 @@ import json
 import time
 import random
 import re
+import asyncio
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from typing import List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import httpx
 from dotenv import load_dotenv
 from pydantic_ai import RunContext
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.prompt import Prompt, Confirm
 
 console = Console()
 
+# Precompiled pattern untuk ekstraksi retry delay dari error message Google API
+_RETRY_DELAY_RE = re.compile(r"'retryDelay': '(\d+)s'")
+
 # ==================================================================================================
 # SETUP AND UTILITIES
 # ==================================================================================================
 
 def parse_google_api_error(error_str):
     """Parse Google API error untuk mendapatkan retry delay dan pesan yang user-friendly."""
+    # Stringify sekali, bukan di setiap pengecekan
+    s = str(error_str)
     try:
         # Cek apakah ini error quota/rate limit
-        if "RESOURCE_EXHAUSTED" in str(error_str) or "429" in str(error_str):
+        if "RESOURCE_EXHAUSTED" in s or "429" in s:
             # Extract retry delay dari error message
-            retry_match = re.search(r"'retryDelay': '(\d+)s'", str(error_str))
+            retry_match = _RETRY_DELAY_RE.search(s)
             if retry_match:
                 retry_seconds = int(retry_match.group(1))
             else:
                 retry_seconds = 60  # Default 60 detik jika tidak ditemukan
-            
+
             return {
                 "is_quota_error": True,
                 "retry_delay": retry_seconds,
                 "user_message": f"Limit penggunaan AI tercapai, tunggu {retry_seconds} detik...",
                 "should_retry": True
             }
-        
+
         # Cek error lainnya yang mungkin perlu handling khusus
-        elif "503" in str(error_str) or "SERVICE_UNAVAILABLE" in str(error_str):
+        elif "503" in s or "SERVICE_UNAVAILABLE" in s:
             return {
                 "is_quota_error": False,
                 "retry_delay": 30,
                 "user_message": "Layanan AI sedang tidak tersedia, mencoba lagi...",
                 "should_retry": True
             }
-        
-        elif "500" in str(error_str) or "INTERNAL" in str(error_str):
+
+        elif "500" in s or "INTERNAL" in s:
             return {
-                "is_quota_error": False, 
+                "is_quota_error": False,
                 "retry_delay": 15,
                 "user_message": "Error internal server AI, mencoba lagi...",
                 "should_retry": True
             }
-        
+
         else:
             return {
                 "is_quota_error": False,
                 "retry_delay": 10,
-                "user_message": f"Error: {str(error_str)[:100]}...",
+                "user_message": f"Error: {s[:100]}...",
                 "should_retry": False
             }
-            
+
     except Exception:
         return {
             "is_quota_error": False,
             "retry_delay": 10,
-            "user_message": f"Error tidak dikenal: {str(error_str)[:100]}...",
+            "user_message": f"Error tidak dikenal: {s[:100]}...",
             "should_retry": False
         }
 
+def _wait_with_status(delay):
+    """Tunggu selama `delay` detik dengan progress bar transient dari rich."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[dim]⏳ Menunggu[/dim]"),
+        BarColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("wait", total=delay)
+        remaining = delay
+        # Tick kasar 5 detik; rendering ditangani refresh thread milik rich
+        while remaining > 0:
+            step = min(5, remaining)
+            time.sleep(step)
+            progress.advance(task, step)
+            remaining -= step
+
 def retry_with_delay_and_confirmation(func, *args, max_retries=3, base_delay=10, **kwargs):
     """
     Fungsi untuk retry dengan delay dan konfirmasi user jika masih error.
@@ -98,34 +133,27 @@ def retry_with_delay_and_confirmation(func, *args, max_retries=3, base_delay=10,
             return result
             
         except Exception as e:
-            error_info = parse_google_api_error(str(e))
-            
+            # Stringify exception sekali untuk seluruh penanganan attempt ini
+            err_str = str(e)
+            error_info = parse_google_api_error(err_str)
+
             # Tampilkan pesan yang user-friendly
             console.print(f"[bold yellow]{error_info['user_message']}[/bold yellow]")
             
             if attempt < max_retries:
                 # Gunakan delay dari API error jika tersedia, atau gunakan exponential backoff
                 if error_info['is_quota_error']:
-                    delay = error_info['retry_delay']
-                    console.print(f"[bold cyan]Menunggu {delay} detik sesuai instruksi API...[/bold cyan]")
+                    # Jitter kecil agar retry paralel tidak serentak menghantam API lagi
+                    delay = error_info['retry_delay'] + random.uniform(0, 2)
+                    console.print(f"[bold cyan]Menunggu {delay:.1f} detik sesuai instruksi API...[/bold cyan]")
                 else:
-                    # Exponential backoff untuk error lainnya
-                    delay = base_delay * (2 ** attempt) + random.uniform(0, 5)
-                    delay = min(delay, 120)  # Maksimal 2 menit
+                    # Exponential backoff dengan full jitter untuk error lainnya
+                    delay = random.uniform(1, min(base_delay * (2 ** attempt), 120))
                     console.print(f"[bold yellow]Menunggu {delay:.1f} detik sebelum mencoba lagi...[/bold yellow]")
                 
-                # Countdown timer dengan progress
-                for i in range(int(delay), 0, -1):
-                    minutes, seconds = divmod(i, 60)
-                    if minutes > 0:
-                        time_str = f"{minutes}m{seconds:02d}s"
-                    else:
-                        time_str = f"{seconds}s"
-                    
-                    console.print(f"\r[dim]⏳ Countdown: {time_str} tersisa[/dim]", end="")
-                    time.sleep(1)
-                console.print("\r" + " " * 30 + "\r", end="")  # Clear countdown
-                
+                # Satu sleep penuh, bukan 60x wakeup + render per detik
+                _wait_with_status(delay)
+
                 continue
             else:
                 # Semua retry gagal
@@ -149,12 +177,7 @@ def retry_with_delay_and_confirmation(func, *args, max_retries=3, base_delay=10,
                     elif user_choice == "tunggu":
                         extra_wait = 120  # Tunggu 2 menit tambahan
                         console.print(f"[bold cyan]Menunggu {extra_wait} detik tambahan...[/bold cyan]")
-                        for i in range(extra_wait, 0, -1):
-                            minutes, seconds = divmod(i, 60)
-                            time_str = f"{minutes}m{seconds:02d}s"
-                            console.print(f"\r[dim]⏳ Extra wait: {time_str} tersisa[/dim]", end="")
-                            time.sleep(1)
-                        console.print("\r" + " " * 30 + "\r", end="")
+                        _wait_with_status(extra_wait)
                         
                         # Coba sekali lagi setelah extra wait
                         try:
@@ -187,21 +210,115 @@ def retry_with_delay_and_confirmation(func, *args, max_retries=3, base_delay=10,
                         console.print("[bold red]Proses dihentikan oleh user.[/bold red]")
                         raise e
 
+async def retry_with_delay_and_confirmation_async(func, *args, max_retries=3, base_delay=10, **kwargs):
+    """
+    Versi async dari retry_with_delay_and_confirmation.
+    Menggunakan asyncio.sleep sehingga retry tidak memblokir event loop
+    dan task lain tetap bisa berjalan selama menunggu.
+
+    Args:
+        func: Coroutine function yang akan dijalankan
+        *args: Arguments untuk fungsi
+        max_retries: Maksimal jumlah retry (default: 3)
+        base_delay: Delay dasar dalam detik (default: 10)
+        **kwargs: Keyword arguments untuk fungsi
+
+    Returns:
+        Result dari fungsi jika berhasil, atau None jika gagal semua
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            result = await func(*args, **kwargs)
+            if attempt > 0:
+                console.print(f"[bold green]Berhasil pada percobaan ke-{attempt + 1}![/bold green]")
+            return result
+
+        except Exception as e:
+            # Stringify exception sekali untuk seluruh penanganan attempt ini
+            err_str = str(e)
+            error_info = parse_google_api_error(err_str)
+            console.print(f"[bold yellow]{error_info['user_message']}[/bold yellow]")
+
+            if attempt < max_retries:
+                if error_info['is_quota_error']:
+                    # Jitter kecil agar stage paralel tidak retry serentak
+                    delay = error_info['retry_delay'] + random.uniform(0, 2)
+                    console.print(f"[bold cyan]Menunggu {delay:.1f} detik sesuai instruksi API...[/bold cyan]")
+                else:
+                    # Full jitter: rata-rata wait lebih pendek dan retry tersebar
+                    delay = random.uniform(1, min(base_delay * (2 ** attempt), 120))
+                    console.print(f"[bold yellow]Menunggu {delay:.1f} detik sebelum mencoba lagi...[/bold yellow]")
+
+                await asyncio.sleep(delay)
+                continue
+            else:
+                # Semua retry gagal, tanya user sekali di akhir
+                console.print(f"\n[bold red]Semua {max_retries + 1} percobaan gagal![/bold red]")
+                console.print(Panel(
+                    f"Error terakhir: {error_info['user_message']}\n\n"
+                    "Apakah Anda ingin melanjutkan ke tahap berikutnya?\n"
+                    "Ketik 'ya' untuk melanjutkan atau 'tidak' untuk berhenti.",
+                    title="[red]Konfirmasi Lanjut[/red]",
+                    border_style="red"
+                ))
+
+                user_choice = Prompt.ask("Lanjutkan", choices=["ya", "tidak"], default="tidak")
+
+                if user_choice.lower() == "ya":
+                    console.print("[bold yellow]Melanjutkan ke tahap berikutnya meskipun ada error...[/bold yellow]")
+                    return None
+                else:
+                    console.print("[bold red]Proses dihentikan oleh user.[/bold red]")
+                    raise e
+
+# Singleton model: semua agent memakai satu provider/HTTP client yang sama
+_MODEL = None
+
+def _build_http_client():
+    """HTTP client async dengan connection pool yang bisa dituning lewat env var."""
+    max_connections = int(os.getenv("GEMINI_MAX_CONNECTIONS", "128"))
+    max_keepalive = int(os.getenv("GEMINI_MAX_KEEPALIVE", "64"))
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive
+        ),
+        timeout=httpx.Timeout(120.0)
+    )
+
 def setup_model():
-    """Memuat environment variables dan menyiapkan model AI."""
+    """Memuat environment variables dan menyiapkan model AI (singleton)."""
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL
+
     load_dotenv()
     google_api_key = os.getenv("GOOGLE_API_KEY")
     if not google_api_key:
         raise ValueError("GOOGLE_API_KEY tidak ditemukan di environment variables.")
-        
-    provider = GoogleProvider(api_key=google_api_key)
-    model = GoogleModel('gemini-2.5-flash', provider=provider)
-    return model
 
-def save_document_file(filename: str, content: str):
+    try:
+        provider = GoogleProvider(api_key=google_api_key, http_client=_build_http_client())
+    except TypeError:
+        # Versi provider lama tanpa dukungan http_client kustom
+        provider = GoogleProvider(api_key=google_api_key)
+    _MODEL = GoogleModel('gemini-2.5-flash', provider=provider)
+    return _MODEL
+
+def json_dumps(obj) -> str:
+    """Serialisasi objek ke JSON string ber-indentasi; pakai orjson jika terpasang."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+
+def save_document_file(filename: str, content):
     """Menyimpan konten ke file JSON dan mencetak pesan konfirmasi."""
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
+    if isinstance(content, bytes):
+        with open(filename, "wb") as f:
+            f.write(content)
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
     console.print(f"\n[bold green]Sukses![/bold green] Dokumen juga disimpan ke file [cyan]{filename}[/cyan]")
 
 def safe_run_agent(agent, prompt, step_name):
@@ -213,6 +330,33 @@ def safe_run_agent(agent, prompt, step_name):
         console.print(f"[bold red]Error di {step_name}:[/bold red] {str(e)}")
         raise
 
+async def safe_run_agent_async(agent, prompt, step_name):
+    """Wrapper async untuk menjalankan agent tanpa memblokir event loop."""
+    try:
+        result = await agent.run(prompt)
+        return result
+    except Exception as e:
+        console.print(f"[bold red]Error di {step_name}:[/bold red] {str(e)}")
+        raise
+
+async def safe_run_agent_stream(agent, prompt, step_name):
+    """
+    Wrapper streaming: cetak token begitu tiba agar time-to-first-token kecil,
+    bukan menunggu seluruh output selesai. Hanya untuk agent dengan output teks.
+    Mengembalikan teks lengkap setelah stream selesai.
+    """
+    try:
+        async with agent.run_stream(prompt) as stream:
+            # markup=False: potongan kode/diagram bisa mengandung karakter markup rich
+            async for chunk in stream.stream_text(delta=True):
+                console.print(chunk, end="", markup=False, highlight=False)
+            output = await stream.get_output()
+        console.print()
+        return output
+    except Exception as e:
+        console.print(f"[bold red]Error di {step_name}:[/bold red] {str(e)}")
+        raise
+
 # ==================================================================================================
 # MEMORY MANAGEMENT
 # ==================================================================================================
@@ -221,27 +365,80 @@ class Memory:
     """Class untuk menyimpan dan mengelola semua dokumen yang dihasilkan selama sesi."""
     def __init__(self):
         self.storage = {}
+        # Generation counter: naik setiap ada perubahan, dipakai untuk invalidasi cache listing
+        self._gen = 0
+        self._listing_cache = (-1, [])
+        # Cache hasil decode per key, diisi lazy saat dokumen pertama kali dibaca
+        self._decoded = {}
 
-    def set(self, key: str, value: str):
-        """Menyimpan atau memperbarui dokumen di memori."""
+    def set(self, key: str, value):
+        """Menyimpan atau memperbarui dokumen di memori. Menerima str atau bytes."""
+        if isinstance(value, str):
+            value = value.encode("utf-8")
         self.storage[key] = value
+        self._decoded.pop(key, None)
+        self._gen += 1
         console.log(f"Memori diperbarui: Dokumen '[bold cyan]{key}[/bold cyan]' telah disimpan.")
 
+    def append(self, key: str, chunk):
+        """
+        Tambahkan potongan ke akhir dokumen tanpa log dan tanpa decode/encode
+        ulang seluruh isi. Untuk key internal yang sering di-append (mis. arsip
+        riwayat chat); dokumen disimpan sebagai bytearray agar append O(1) amortized.
+        """
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        buf = self.storage.get(key)
+        if not isinstance(buf, bytearray):
+            buf = bytearray(buf or b"")
+            self.storage[key] = buf
+        buf += chunk
+        self._decoded.pop(key, None)
+        self._gen += 1
+
     def get(self, key: str) -> str:
         """Mengambil dokumen dari memori berdasarkan kuncinya."""
-        return self.storage.get(key, f"Error: Dokumen dengan nama '{key}' tidak ditemukan.")
+        data = self.storage.get(key)
+        if data is None:
+            return f"Error: Dokumen dengan nama '{key}' tidak ditemukan."
+        text = self._decoded.get(key)
+        if text is None:
+            text = data.decode("utf-8")
+            self._decoded[key] = text
+        return text
 
     def list_documents(self) -> List[str]:
         """Mengembalikan daftar semua nama dokumen yang tersimpan di memori."""
-        return list(self.storage.keys())
+        cached_gen, listing = self._listing_cache
+        if cached_gen != self._gen:
+            listing = list(self.storage.keys())
+            self._listing_cache = (self._gen, listing)
+        return listing
+
+def build_context(memory: Memory, keys: List[str]) -> str:
+    """
+    Gabungkan dokumen-dokumen dari memori menjadi satu buffer konteks.
+    Dokumen yang sudah pasti dibutuhkan sebuah tahap bisa langsung disuntikkan
+    ke prompt, menghemat roundtrip read_document_tool per dokumen.
+    """
+    parts = []
+    for key in keys:
+        if key in memory.storage:
+            parts.append(f"<doc name='{key}'>\n{memory.get(key)}\n</doc>")
+    return "\n\n".join(parts)
 
 # ==================================================================================================
 # TOOLS
 # ==================================================================================================
 
+@lru_cache(maxsize=64)
+def _cached_panel(text: str, title: str, border_style: str) -> Panel:
+    """Panel yang di-cache; kombinasi (text, title, border) berulang tidak di-layout ulang."""
+    return Panel(text, title=title, border_style=border_style)
+
 def user_input_tool(ctx: RunContext, prompt: str) -> str:
     """Meminta input dari pengguna dengan pesan tertentu."""
-    console.print(Panel(f"[bold yellow]{prompt}[/bold yellow]", title="[cyan]Butuh Input Anda[/cyan]", border_style="cyan"))
+    console.print(_cached_panel(f"[bold yellow]{prompt}[/bold yellow]", "[cyan]Butuh Input Anda[/cyan]", "cyan"))
     response = Prompt.ask(">>> ")
     return response
 
@@ -250,80 +447,125 @@ def create_memory_tools(memory: Memory):
     def list_available_documents_tool(ctx: RunContext, prompt: str) -> str:
         """Gunakan tool ini untuk melihat daftar semua dokumen yang tersedia di memori."""
         docs = memory.list_documents()
-        console.print(Panel(
+        console.print(_cached_panel(
             f"Tool: [bold cyan]list_available_documents_tool[/bold cyan]\nAksi: Menampilkan dokumen di memori.\nHasil: {docs}",
-            title="[green]Tool Digunakan[/green]", border_style="green"
+            _TOOL_USED_TITLE, "green"
         ))
         return f"Dokumen yang tersedia adalah: {', '.join(docs)}"
 
     def read_document_tool(ctx: RunContext, document_name: str) -> str:
         """Gunakan tool ini untuk membaca isi dari dokumen spesifik yang ada di memori. Wajib sertakan nama dokumen yang valid."""
         content = memory.get(document_name)
-        console.print(Panel(
+        console.print(_cached_panel(
             f"Tool: [bold cyan]read_document_tool[/bold cyan]\nAksi: Membaca dokumen '[yellow]{document_name}[/yellow]'.",
-            title="[green]Tool Digunakan[/green]", border_style="green"
+            _TOOL_USED_TITLE, "green"
         ))
         return content
 
     return [list_available_documents_tool, read_document_tool]
 
+# String hasil tool yang konstan, dibangun sekali saat import
+_TOOL_USED_TITLE = "[green]Tool Digunakan[/green]"
+_MERMAID_OK = "Kode Mermaid terlihat valid! Tidak ditemukan error syntax."
+_MERMAID_OK_PANEL = Panel(
+    "Tool: [bold cyan]mermaid_debug_tool[/bold cyan]\nKode Mermaid valid!",
+    title="[green]Mermaid Debug Success[/green]", border_style="green"
+)
+
+# Konstanta validasi Mermaid, dibangun sekali saat import
+_VALID_DIAGRAMS = (
+    "flowchart", "graph", "sequenceDiagram", "classDiagram",
+    "stateDiagram", "erDiagram", "pie", "gantt", "gitgraph",
+    "architecture", "c4Context", "c4Container", "c4Component"
+)
+_INVALID_NODE_CHARS = frozenset(' -+=!@#$%^&*')
+# Batas ukuran input validator; kode Mermaid dari LLM adalah input tak terpercaya
+_MERMAID_MAX_BYTES = 65536
+
+def _extract_node_id(fragment: str) -> str:
+    """Ambil node ID dari fragmen koneksi, buang label dalam bracket/paren."""
+    # find + satu slice, bukan rantai split yang membuat list & string perantara
+    end = len(fragment)
+    i = fragment.find('[')
+    if 0 <= i < end:
+        end = i
+    j = fragment.find('(')
+    if 0 <= j < end:
+        end = j
+    return fragment[:end].strip()
+
+def _validate_mermaid(mermaid_code: str) -> List[str]:
+    """
+    Validasi syntax dasar kode Mermaid dalam satu pass per baris.
+    Mengembalikan daftar error (kosong jika valid).
+    """
+    # Hard cap dulu, sebelum kerja O(N) apa pun
+    if len(mermaid_code) > _MERMAID_MAX_BYTES:
+        return [f"Kode Mermaid melebihi batas {_MERMAID_MAX_BYTES // 1024}KB"]
+
+    errors = []
+    lines = mermaid_code.strip().split('\n')
+
+    # Check for basic Mermaid structure
+    if not lines:
+        errors.append("Kode Mermaid kosong")
+
+    first_line = lines[0].strip() if lines else ""
+
+    # startswith menerima tuple dan melakukan prefix match di level C
+    if not first_line.startswith(_VALID_DIAGRAMS):
+        # Tanpa header yang valid, pengecekan lanjutan tidak bermakna; berhenti di sini
+        errors.append(f"Diagram type tidak valid. Harus dimulai dengan salah satu: {', '.join(_VALID_DIAGRAMS)}")
+        return errors
+
+    # Check for common syntax errors: satu pass Counter, bukan enam scan count()
+    counts = Counter(mermaid_code)
+    bracket_count = counts['['] - counts[']']
+    paren_count = counts['('] - counts[')']
+    brace_count = counts['{'] - counts['}']
+
+    if bracket_count != 0:
+        errors.append(f"Bracket tidak seimbang: {bracket_count} bracket tidak tertutup")
+    if paren_count != 0:
+        errors.append(f"Parenthesis tidak seimbang: {paren_count} parenthesis tidak tertutup")
+    if brace_count != 0:
+        errors.append(f"Brace tidak seimbang: {brace_count} brace tidak tertutup")
+
+    # Check for invalid characters in node IDs; partition memecah sekali per baris
+    # islice: lewati baris pertama tanpa menyalin seluruh list
+    for line in islice(lines, 1, None):  # Skip first line (diagram type)
+        # Batasi jumlah error agar input rusak tidak memicu kerja tak terbatas
+        if len(errors) >= 16:
+            errors.append("... error selanjutnya dipotong (terlalu banyak)")
+            break
+
+        # Coba panah panjang dulu agar 'A ---> B' tidak menyisakan '-' di node ID
+        head, sep, tail = line.partition('--->')
+        if not sep:
+            head, sep, tail = line.partition('-->')
+        if not sep:
+            continue
+        # Koneksi berantai (A --> B --> C) dilewati, seperti perilaku
+        # len(parts) != 2 sebelumnya; tail yang masih berisi panah bukan node ID
+        if '-->' in tail:
+            continue
+
+        node1 = _extract_node_id(head)
+        node2 = _extract_node_id(tail)
+
+        for node in (node1, node2):
+            # isdisjoint berjalan di level C; jalur detail hanya saat ada pelanggaran
+            if not _INVALID_NODE_CHARS.isdisjoint(node):
+                for char in sorted(_INVALID_NODE_CHARS.intersection(node)):
+                    errors.append(f"Node ID '{node}' mengandung karakter tidak valid: '{char}'")
+
+    return errors
+
 def mermaid_debug_tool(ctx: RunContext, mermaid_code: str) -> str:
     """Tool untuk debug dan validasi kode Mermaid."""
     try:
-        # Basic syntax validation
-        lines = mermaid_code.strip().split('\n')
-        errors = []
-        
-        # Check for basic Mermaid structure
-        if not lines:
-            errors.append("Kode Mermaid kosong")
-            
-        first_line = lines[0].strip() if lines else ""
-        valid_diagrams = [
-            "flowchart", "graph", "sequenceDiagram", "classDiagram", 
-            "stateDiagram", "erDiagram", "pie", "gantt", "gitgraph",
-            "architecture", "c4Context", "c4Container", "c4Component"
-        ]
-        
-        if not any(first_line.startswith(diagram) for diagram in valid_diagrams):
-            errors.append(f"Diagram type tidak valid. Harus dimulai dengan salah satu: {', '.join(valid_diagrams)}")
-        
-        # Check for common syntax errors
-        bracket_count = mermaid_code.count('[') - mermaid_code.count(']')
-        paren_count = mermaid_code.count('(') - mermaid_code.count(')')
-        brace_count = mermaid_code.count('{') - mermaid_code.count('}')
-        
-        if bracket_count != 0:
-            errors.append(f"Bracket tidak seimbang: {bracket_count} bracket tidak tertutup")
-        if paren_count != 0:
-            errors.append(f"Parenthesis tidak seimbang: {paren_count} parenthesis tidak tertutup")
-        if brace_count != 0:
-            errors.append(f"Brace tidak seimbang: {brace_count} brace tidak tertutup")
-        
-        # Check for invalid characters in node IDs
-        for line in lines[1:]:  # Skip first line (diagram type)
-            if '-->' in line or '--->' in line:
-                # This is a connection line, check node IDs
-                parts = line.split('-->')
-                if len(parts) != 2:
-                    parts = line.split('--->')
-                
-                if len(parts) == 2:
-                    node1 = parts[0].strip()
-                    node2 = parts[1].strip()
-                    
-                    # Remove labels in brackets
-                    node1 = node1.split('[')[0].split('(')[0].strip()
-                    node2 = node2.split('[')[0].split('(')[0].strip()
-                    
-                    # Check for invalid characters
-                    invalid_chars = [' ', '-', '+', '=', '!', '@', '#', '$', '%', '^', '&', '*']
-                    for char in invalid_chars:
-                        if char in node1:
-                            errors.append(f"Node ID '{node1}' mengandung karakter tidak valid: '{char}'")
-                        if char in node2:
-                            errors.append(f"Node ID '{node2}' mengandung karakter tidak valid: '{char}'")
-        
+        errors = _validate_mermaid(mermaid_code)
+
         if errors:
             console.print(Panel(
                 f"Tool: [bold cyan]mermaid_debug_tool[/bold cyan]\nDitemukan {len(errors)} error:\n" + 
@@ -332,11 +574,8 @@ def mermaid_debug_tool(ctx: RunContext, mermaid_code: str) -> str:
             ))
             return f"Ditemukan {len(errors)} error dalam kode Mermaid:\n" + "\n".join([f"- {error}" for error in errors])
         else:
-            console.print(Panel(
-                f"Tool: [bold cyan]mermaid_debug_tool[/bold cyan]\nKode Mermaid valid!",
-                title="[green]Mermaid Debug Success[/green]", border_style="green"
-            ))
-            return "Kode Mermaid terlihat valid! Tidak ditemukan error syntax."
+            console.print(_MERMAID_OK_PANEL)
+            return _MERMAID_OK
             
     except Exception as e:
         error_msg = f"Error saat debug Mermaid: {str(e)}"
@@ -353,8 +592,13 @@ def create_documentation_tools(memory: Memory):
     def save_markdown_file_tool(ctx: RunContext, filename: str, content: str) -> str:
         """Tool untuk menyimpan file markdown."""
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Encode sekali + satu os.write; lewati incremental encoder TextIOWrapper
+            data = content.encode("utf-8")
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
             console.print(Panel(
                 f"Tool: [bold cyan]save_markdown_file_tool[/bold cyan]\nFile berhasil disimpan: {filename}",
                 title="[green]File Saved[/green]", border_style="green"
@@ -3,30 +3,30 @@ LangGraph Agentic Workflow Orchestrator for SSDLC
 Acts as a chat-based orchestrator that uses intelligent agents to understand user intent 
 and automatically triggers workflow stages based on agent analysis.
 """
-import json
+import os
 import re
+import asyncio
+import hashlib
+from collections import OrderedDict, deque
 from typing import Dict, Any, List, Optional, TypedDict, Annotated
 from dataclasses import dataclass
 
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-# Import agents
-from agents.interview_agent import create_interview_agent
-from agents.environment_agent import create_environment_agent
-from agents.security_agent import create_security_requirement_agent
-from agents.design_agent import create_design_agent
-from agents.documentation_agent import create_generator_agent
+# Factory agent per tahap di-import lazy di _stage_agent: sesi yang hanya
+# memakai chat_mode tidak perlu membayar import + konstruksi kelima agent
 
 # Import shared utilities
 from agents.utils import (
     setup_model, Memory, create_memory_tools,
-    save_document_file, safe_run_agent, retry_with_delay_and_confirmation,
+    save_document_file, safe_run_agent_async,
+    safe_run_agent_stream,
+    retry_with_delay_and_confirmation_async,
     console
 )
 
@@ -34,6 +34,109 @@ from agents.utils import (
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
+# Batas riwayat pesan yang dibawa di state; sesi panjang tidak lagi menumbuhkan
+# list tanpa batas (pesan terlama diarsip ke shared memory, lihat _append_messages)
+_MAX_MESSAGES = 40
+
+# Keyword pre-classifier: alternation yang dikompilasi sekali saat import.
+# Satu re.search memindai input dalam satu pass, menggantikan belasan
+# substring search `any(kw in input for kw in ...)` di hot path chat.
+# Urutan pengecekan (app > help > status) dipertahankan lewat tiga pattern terpisah.
+_APP_KEYWORDS_RE = re.compile(
+    r"make app|create app|build app|develop app"
+    r"|make application|create application|build application"
+    r"|new app(?:lication)?|app development"
+    r"|cashier app|pos app|inventory app|management app"
+)
+_HELP_KEYWORDS_RE = re.compile(r"help|what can you do|commands|how to")
+_STATUS_KEYWORDS_RE = re.compile(r"status|progress|where are we|current stage")
+
+# Renderable dan teks statis dibangun sekali saat import, bukan per pemanggilan
+_WELCOME_PANEL = Panel(
+    "🤖 SSDLC Agentic Orchestrator with AI Intent Understanding\n\n"
+    "I use advanced AI agents to understand your intent and guide you!\n"
+    "• To create an app: describe what you want to build in natural language\n"
+    "• For general chat: ask me anything about software development\n"
+    "• For help: ask 'what can you do?' or 'help'\n"
+    "• Type 'exit' to quit\n\n"
+    "💡 I'll intelligently analyze your messages to provide the best assistance!",
+    title="[bold magenta]Welcome to AI-Powered SSDLC[/bold magenta]",
+    style="cyan"
+)
+
+_COMPLETE_PANEL = Panel(
+    "🎉 App Development Workflow Complete!\n\nAll documents and code have been generated. You can now continue with normal chat.",
+    title="[bold magenta]Workflow Completed[/bold magenta]",
+    style="green"
+)
+
+# Default bersama untuk lookup dict di hot path chat; state.get(..., {})
+# mengalokasikan dict kosong baru pada tiap pemanggilan. Jangan pernah dimutasi.
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Prefix bergaya dibangun sekali sebagai Text; rich tidak perlu mem-parse
+# markup "[bold cyan]...[/bold cyan]" ulang pada tiap turn
+_ASSISTANT_PREFIX = Text("🤖 Assistant:", style="bold cyan")
+_ERROR_PREFIX = Text("❌ Error:", style="bold red")
+
+# Perintah keluar dari loop chat; guard panjang menghindari .lower() atas
+# input panjang yang jelas bukan perintah exit
+_EXIT_CMDS = frozenset({"exit", "quit", "bye"})
+
+# Deteksi sapaan: membership token (bukan substring) supaya "this" tidak
+# dianggap mengandung sapaan "hi"; frasa dua kata tetap dicek sebagai substring
+_GREETING_WORDS = frozenset({"hi", "hello", "hey"})
+_GREETING_PHRASES = ("good morning", "good afternoon")
+_GREETING_REPLY = ("Hello! I'm here to help you with secure software development. "
+                   "What would you like to work on today?")
+
+_HELP_TEXT = (
+    "I'm your SSDLC assistant! I can help you with:\n"
+    "• App development workflow (just say 'make app' or 'create application')\n"
+    "• General questions about software development\n"
+    "• Security requirements and best practices\n"
+    "• System design guidance\n\n"
+    "To start building an app, just tell me what kind of application you want to create!"
+)
+
+# Urutan tahap workflow; indeks dipakai sebagai posisi bit pada mask penyelesaian
+_STAGES = ("interview", "environment", "security", "design", "generation")
+
+def _route_active(current_stage: str, stage_completed: dict) -> str:
+    """Cascade routing untuk workflow aktif; dipanggil saat membangun tabel."""
+    if current_stage == "interview" and not stage_completed.get("interview", False):
+        return "interview_stage"
+    if current_stage in ("environment", "security") and not (
+        stage_completed.get("environment", False)
+        and stage_completed.get("security", False)
+    ):
+        return "requirements_stage"
+    if current_stage == "design" and not stage_completed.get("design", False):
+        return "design_stage"
+    if current_stage == "generation" and not stage_completed.get("generation", False):
+        return "generation_stage"
+    if all(stage_completed.values()):
+        return "end"
+    return "interview_stage"
+
+def _build_routing_table() -> dict:
+    """
+    Tabel transisi (current_stage, mask_penyelesaian) -> node tujuan,
+    dihitung sekali saat import dengan mengevaluasi cascade asli untuk semua
+    kombinasi. Routing per-turn jadi satu lookup dict, bukan rentetan
+    perbandingan string.
+    """
+    table = {}
+    for stage in _STAGES + ("",):
+        for mask in range(1 << len(_STAGES)):
+            completed = {s: bool(mask & (1 << i)) for i, s in enumerate(_STAGES)}
+            table[(stage, mask)] = _route_active(stage, completed)
+        # Entri khusus dict kosong: semua get() False tapi all() vacuously True
+        table[(stage, -1)] = _route_active(stage, {})
+    return table
+
+_ROUTING_TABLE = _build_routing_table()
+
 # Intent Understanding Models
 class IntentAnalysis(BaseModel):
     """Model for intent analysis results"""
@@ -87,9 +190,43 @@ Be precise and confident in your analysis.
             system_prompt=intent_prompt,
             output_type=IntentAnalysis
         )
-    
-    def analyze_intent(self, user_input: str, workflow_status: dict) -> IntentAnalysis:
+
+        # LRU cache hasil analisis intent; input identik pada status workflow yang
+        # sama tidak perlu roundtrip LLM kedua
+        self._cache: "OrderedDict[tuple, IntentAnalysis]" = OrderedDict()
+        self._cache_max_size = 128
+
+    @staticmethod
+    def _cache_key(user_input: str, workflow_status: dict) -> tuple:
+        """Kunci cache: input ternormalisasi + bagian status yang mempengaruhi hasil"""
+        return (
+            user_input.lower().strip(),
+            workflow_status.get("workflow_active", False),
+            workflow_status.get("current_stage", ""),
+            tuple(sorted(workflow_status.get("stage_completed", {}).items()))
+        )
+
+    def _cache_put(self, cache_key: tuple, analysis: IntentAnalysis):
+        """Simpan hasil analisis ke cache dengan eviksi LRU"""
+        self._cache[cache_key] = analysis
+        if len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+
+    async def analyze_intent_async(self, user_input: str, workflow_status: dict) -> IntentAnalysis:
         """Analyze user intent and return structured decision"""
+        cache_key = self._cache_key(user_input, workflow_status)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        # Pre-classifier keyword deterministik dulu; LLM hanya jadi tiebreaker
+        # untuk input yang ambigu
+        keyword_result = self._fallback_intent_analysis(user_input, workflow_status)
+        if keyword_result.confidence >= 0.9:
+            self._cache_put(cache_key, keyword_result)
+            return keyword_result
+
         try:
             # Create context for the agent
             context = f"""
@@ -103,34 +240,28 @@ Current workflow status:
 Analyze this input and determine the user's intent.
 """
             
-            # Use pydantic_ai Agent to analyze intent
-            result = self.agent.run_sync(context)
+            # Use pydantic_ai Agent to analyze intent (async, tidak memblokir loop)
+            result = await self.agent.run(context)
+
+            self._cache_put(cache_key, result.output)
             return result.output  # Use .output instead of .data
-            
+
         except Exception as e:
             console.print(f"[bold red]Intent analysis error:[/bold red] {e}")
             # Fallback to simple keyword matching
-            return self._fallback_intent_analysis(user_input, workflow_status)
+            return keyword_result
     
+    async def analyze_intent_batch(self, inputs: List[str], workflow_status: dict) -> List[IntentAnalysis]:
+        """Analisis banyak input sekaligus; stall k panggilan LLM menjadi max(L_i)"""
+        return await asyncio.gather(
+            *(self.analyze_intent_async(user_input, workflow_status) for user_input in inputs)
+        )
+
     def _fallback_intent_analysis(self, user_input: str, workflow_status: dict) -> IntentAnalysis:
         """Fallback intent analysis using simple keyword matching"""
         user_input_lower = user_input.lower().strip()
-        
-        # App development keywords
-        app_keywords = [
-            "make app", "create app", "build app", "develop app",
-            "make application", "create application", "build application",
-            "new app", "new application", "app development",
-            "cashier app", "pos app", "inventory app", "management app"
-        ]
-        
-        # Help keywords
-        help_keywords = ["help", "what can you do", "commands", "how to"]
-        
-        # Status keywords
-        status_keywords = ["status", "progress", "where are we", "current stage"]
-        
-        if any(keyword in user_input_lower for keyword in app_keywords):
+
+        if _APP_KEYWORDS_RE.search(user_input_lower):
             if not workflow_status.get("workflow_active", False):
                 return IntentAnalysis(
                     intent_type="app_development",
@@ -147,7 +278,7 @@ Analyze this input and determine the user's intent.
                     workflow_action="continue_workflow",
                     reasoning="User mentioned app development and workflow is already active"
                 )
-        elif any(keyword in user_input_lower for keyword in help_keywords):
+        elif _HELP_KEYWORDS_RE.search(user_input_lower):
             return IntentAnalysis(
                 intent_type="help",
                 confidence=0.9,
@@ -155,7 +286,7 @@ Analyze this input and determine the user's intent.
                 workflow_action="chat_mode",
                 reasoning="User is asking for help"
             )
-        elif any(keyword in user_input_lower for keyword in status_keywords):
+        elif _STATUS_KEYWORDS_RE.search(user_input_lower):
             return IntentAnalysis(
                 intent_type="status",
                 confidence=0.9,
@@ -172,6 +303,23 @@ Analyze this input and determine the user's intent.
                 reasoning="General conversation detected"
             )
 
+@dataclass(frozen=True)
+class DocumentHandle:
+    """
+    Pointer ringan ke dokumen di shared Memory.
+    State graph hanya membawa kunci + digest, bukan seluruh payload JSON,
+    sehingga copy state antar-node tetap O(jumlah dokumen) bukan O(total bytes).
+    Isi dokumen diambil lewat config.memory.get(handle.key).
+    """
+    key: str
+    digest: str
+
+    @classmethod
+    def of(cls, key: str, blob) -> "DocumentHandle":
+        if isinstance(blob, str):
+            blob = blob.encode("utf-8")
+        return cls(key, hashlib.blake2b(blob, digest_size=16).hexdigest())
+
 # State for the graph
 class WorkflowState(TypedDict):
     messages: Annotated[List, "List of conversation messages"]
@@ -191,6 +339,14 @@ class OrchestrationConfig:
     memory_tools: List
     console: Console
     intent_agent: IntentUnderstandingAgent
+    # Agent per tahap dibangun sekali secara lazy (lihat _stage_agent);
+    # konstruksi Agent (parse prompt, registrasi tool, build schema) adalah
+    # kerja konstan yang tidak perlu diulang tiap turn
+    interview_agent: Any = None
+    environment_agent: Any = None
+    security_agent: Any = None
+    design_agent: Any = None
+    generator_agent: Any = None
 
 class SSLDCOrchestrator:
     """
@@ -202,6 +358,10 @@ class SSLDCOrchestrator:
     def __init__(self):
         self.config = self._setup_config()
         self.workflow = self._create_workflow()
+        # Cache stat per file: path -> (st_mtime_ns, exists), supaya turn chat
+        # berikutnya tidak mengulang syscall untuk file yang tidak berubah
+        self._file_cache: Dict[str, tuple] = {}
+        self._interview_mtime_ns = None
         
     def _setup_config(self) -> OrchestrationConfig:
         """Setup the orchestrator configuration"""
@@ -209,7 +369,7 @@ class SSLDCOrchestrator:
         shared_memory = Memory()
         memory_tools = create_memory_tools(shared_memory)
         intent_agent = IntentUnderstandingAgent(model)
-        
+
         return OrchestrationConfig(
             model=model,
             memory=shared_memory,
@@ -217,6 +377,34 @@ class SSLDCOrchestrator:
             console=console,
             intent_agent=intent_agent
         )
+
+    def _stage_agent(self, name: str):
+        """
+        Bangun agent tahap saat pertama kali dibutuhkan, lalu cache di config.
+        Import factory ditunda ke sini agar startup dan sesi chat-only tidak
+        membayar import + konstruksi agent yang tidak pernah dipakai.
+        """
+        agent = getattr(self.config, f"{name}_agent")
+        if agent is None:
+            if name == "interview":
+                from agents.interview_agent import create_interview_agent
+                agent = create_interview_agent(self.config.model)
+            elif name == "environment":
+                from agents.environment_agent import create_environment_agent
+                agent = create_environment_agent(self.config.model, self.config.memory_tools)
+            elif name == "security":
+                from agents.security_agent import create_security_requirement_agent
+                agent = create_security_requirement_agent(self.config.model, self.config.memory_tools)
+            elif name == "design":
+                from agents.design_agent import create_design_agent
+                agent = create_design_agent(self.config.model, self.config.memory_tools)
+            elif name == "generator":
+                from agents.documentation_agent import create_generator_agent
+                agent = create_generator_agent(self.config.model, self.config.memory_tools)
+            else:
+                raise ValueError(f"Unknown stage agent: {name}")
+            setattr(self.config, f"{name}_agent", agent)
+        return agent
     
     def _create_workflow(self) -> StateGraph:
         """Create the LangGraph workflow"""
@@ -226,8 +414,7 @@ class SSLDCOrchestrator:
         workflow.add_node("intent_agent", self._intent_analysis)
         workflow.add_node("chat_mode", self._chat_mode)
         workflow.add_node("interview_stage", self._interview_stage)
-        workflow.add_node("environment_stage", self._environment_stage)
-        workflow.add_node("security_stage", self._security_stage)
+        workflow.add_node("requirements_stage", self._requirements_stage)
         workflow.add_node("design_stage", self._design_stage)
         workflow.add_node("generation_stage", self._generation_stage)
         workflow.add_node("workflow_complete", self._workflow_complete)
@@ -242,8 +429,7 @@ class SSLDCOrchestrator:
             {
                 "chat_mode": "chat_mode",
                 "interview_stage": "interview_stage",
-                "environment_stage": "environment_stage",
-                "security_stage": "security_stage", 
+                "requirements_stage": "requirements_stage",
                 "design_stage": "design_stage",
                 "generation_stage": "generation_stage",
                 "end": END
@@ -251,9 +437,8 @@ class SSLDCOrchestrator:
         )
         
         # Workflow progression
-        workflow.add_edge("interview_stage", "environment_stage")
-        workflow.add_edge("environment_stage", "security_stage")
-        workflow.add_edge("security_stage", "design_stage")
+        workflow.add_edge("interview_stage", "requirements_stage")
+        workflow.add_edge("requirements_stage", "design_stage")
         workflow.add_edge("design_stage", "generation_stage")
         workflow.add_edge("generation_stage", "workflow_complete")
         
@@ -261,13 +446,13 @@ class SSLDCOrchestrator:
         workflow.add_edge("chat_mode", END)
         workflow.add_edge("workflow_complete", END)
         
-        # Setup memory
-        memory = MemorySaver()
-        app = workflow.compile(checkpointer=memory)
-        
+        # Tanpa checkpointer per-node: state lengkap sudah dibawa antar-turn oleh
+        # run_chat_async, jadi persist cukup sekali di akhir invoke (hasil ainvoke)
+        app = workflow.compile()
+
         return app
     
-    def _intent_analysis(self, state: WorkflowState) -> WorkflowState:
+    async def _intent_analysis(self, state: WorkflowState) -> WorkflowState:
         """Intent analysis node - uses agent to understand user intent"""
         user_input = state.get("user_input", "").strip()
         
@@ -289,7 +474,7 @@ class SSLDCOrchestrator:
         console.print("[bold blue]🧠 Analyzing intent...[/bold blue]")
         
         try:
-            intent_result = self.config.intent_agent.analyze_intent(user_input, workflow_status)
+            intent_result = await self.config.intent_agent.analyze_intent_async(user_input, workflow_status)
             
             console.print(f"[bold green]Intent:[/bold green] {intent_result.intent_type} "
                          f"[bold yellow]({intent_result.confidence:.2f})[/bold yellow]")
@@ -385,38 +570,88 @@ class SSLDCOrchestrator:
         
         return state
     
+    @staticmethod
+    def _stat_mtime_ns(filename: str):
+        """Satu os.stat per file: mtime_ns jika ada, None jika tidak (EAFP)."""
+        try:
+            return os.stat(filename).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def _check_existing_workflow_files(self) -> Dict[str, bool]:
         """Check which workflow files already exist"""
-        import os
-        
         files_to_check = {
             "interview": "Interview_Results.json",
-            "environment": "Environment_Requirements.json", 
+            "environment": "Environment_Requirements.json",
             "security": "Security_Requirements.json",
             "design": "System_Design.json"
         }
-        
+        needed = {filename: stage for stage, filename in files_to_check.items()}
+
+        # Satu pass scandir atas direktori kerja, bukan satu stat per file;
+        # mtime diambil dari entry yang sama untuk deteksi perubahan
+        found = {}
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name in needed and entry.is_file():
+                    found[entry.name] = entry.stat().st_mtime_ns
+
         existing_files = {}
         for stage, filename in files_to_check.items():
-            existing_files[stage] = os.path.exists(filename)
-            if existing_files[stage]:
+            mtime_ns = found.get(filename)
+            exists = mtime_ns is not None
+            existing_files[stage] = exists
+            # Hanya umumkan file yang baru muncul/berubah, bukan tiap turn chat
+            if exists and self._file_cache.get(filename) != (mtime_ns, True):
                 console.print(f"[bold blue]📄 Found existing:[/bold blue] {filename}")
-        
+            self._file_cache[filename] = (mtime_ns, exists)
+
         return existing_files
-    
+
+    # Pemetaan kunci memory -> file dokumen di disk
+    _DOCUMENT_FILES = {
+        "interview_results": "Interview_Results.json",
+        "environment_requirements": "Environment_Requirements.json",
+        "security_requirements": "Security_Requirements.json",
+        "system_design": "System_Design.json",
+    }
+
     def _load_existing_interview_data(self):
         """Load existing interview data into memory"""
         try:
-            import json
-            with open("Interview_Results.json", "r", encoding="utf-8") as f:
+            mtime_ns = self._stat_mtime_ns("Interview_Results.json")
+            if mtime_ns is not None and mtime_ns == self._interview_mtime_ns:
+                # File tidak berubah sejak load terakhir; isi memory masih valid
+                return
+
+            # Baca sebagai bytes: Memory menyimpan bytes, jadi decode/encode
+            # bolak-balik untuk dokumen besar bisa dilewati sama sekali
+            with open("Interview_Results.json", "rb") as f:
                 interview_data = f.read()
-            
-            # Load into shared memory
-            self.config.memory.set("interview_results", interview_data)
+
+            # Load into shared memory (skip jika payload identik dengan yang tersimpan)
+            if self.config.memory.storage.get("interview_results") != interview_data:
+                self.config.memory.set("interview_results", interview_data)
+            self._interview_mtime_ns = mtime_ns
             console.print("[bold green]✅ Loaded existing interview data into memory[/bold green]")
-            
+
         except Exception as e:
             console.print(f"[bold red]❌ Error loading interview data:[/bold red] {e}")
+
+    def _load_all_existing_data(self):
+        """Load semua dokumen workflow yang ada di disk ke shared memory."""
+        for key, filename in self._DOCUMENT_FILES.items():
+            try:
+                with open(filename, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                console.print(f"[bold red]❌ Error loading {filename}:[/bold red] {e}")
+                continue
+            if self.config.memory.storage.get(key) != data:
+                self.config.memory.set(key, data)
+        console.print("[bold green]✅ Loaded existing workflow documents into memory[/bold green]")
     
     def _intent_condition(self, state: WorkflowState) -> str:
         """Conditional logic based on intent analysis"""
@@ -463,65 +698,83 @@ class SSLDCOrchestrator:
         if state.get("workflow_active", False):
             current_stage = state.get("current_stage", "")
             stage_completed = state.get("stage_completed", {})
-            
-            # Route to current stage if not completed
-            if current_stage == "interview" and not stage_completed.get("interview", False):
-                return "interview_stage"
-            elif current_stage == "environment" and not stage_completed.get("environment", False):
-                return "environment_stage"
-            elif current_stage == "security" and not stage_completed.get("security", False):
-                return "security_stage"
-            elif current_stage == "design" and not stage_completed.get("design", False):
-                return "design_stage"
-            elif current_stage == "generation" and not stage_completed.get("generation", False):
-                return "generation_stage"
-            elif all(stage_completed.values()):
-                return "end"
-        
+
+            # Satu lookup pada tabel transisi yang sudah dihitung saat import
+            if stage_completed:
+                mask = 0
+                for i, stage in enumerate(_STAGES):
+                    if stage_completed.get(stage, False):
+                        mask |= 1 << i
+            else:
+                mask = -1
+            dest = _ROUTING_TABLE.get((current_stage, mask))
+            if dest is None:
+                # Stage di luar tabel (tidak seharusnya terjadi): evaluasi langsung
+                dest = _route_active(current_stage, stage_completed)
+            return dest
+
         # Default case - start from interview
         return "interview_stage"
     
+    def _append_messages(self, state: WorkflowState, *new_messages):
+        """Tambah pesan ke riwayat terbatas; pesan yang tergeser diarsip ke memory."""
+        msgs = state["messages"]
+        if not isinstance(msgs, deque):
+            # State lama (mis. dari run_batch atau resume) masih berupa list
+            msgs = deque(msgs, maxlen=_MAX_MESSAGES)
+            state["messages"] = msgs
+        for msg in new_messages:
+            if len(msgs) == _MAX_MESSAGES:
+                # Append diam-diam tanpa menyalin seluruh arsip dan tanpa
+                # console.log per eviksi (Memory.set akan berisik tiap turn)
+                self.config.memory.append(
+                    "message_history_compressed",
+                    f"{type(msgs[0]).__name__}: {msgs[0].content}\n"
+                )
+            msgs.append(msg)
+
     def _chat_mode(self, state: WorkflowState) -> WorkflowState:
         """Regular chat mode - general conversation"""
         user_input = state.get("user_input", "")
-        
+
         # Simple AI response for general chat
         response = self._generate_chat_response(user_input, state)
-        
+
         # Add to message history
-        state["messages"].append(HumanMessage(content=user_input))
-        state["messages"].append(AIMessage(content=response))
+        self._append_messages(
+            state,
+            HumanMessage(content=user_input),
+            AIMessage(content=response)
+        )
         state["last_agent_response"] = response
         
         console.print(f"[bold cyan]Assistant:[/bold cyan] {response}")
         
         return state
     
-    def _interview_stage(self, state: WorkflowState) -> WorkflowState:
+    async def _interview_stage(self, state: WorkflowState) -> WorkflowState:
         """Interview stage - collect requirements"""
         console.print("\n[bold]🎤 Starting Interview Stage[/bold]")
         
-        interview_agent = create_interview_agent(self.config.model)
+        interview_agent = self._stage_agent("interview")
         user_input = state.get("user_input", "")
         
         try:
-            interview_result = retry_with_delay_and_confirmation(
-                safe_run_agent,
+            interview_result = await retry_with_delay_and_confirmation_async(
+                safe_run_agent_async,
                 interview_agent,
                 user_input,
                 "Interview Stage"
             )
             
             if interview_result is not None:
-                interview_structured = json.dumps(
-                    interview_result.output.model_dump(), 
-                    indent=2, 
-                    default=str, 
-                    ensure_ascii=False
-                )
+                # Serializer Rust pydantic-core langsung ke JSON, tanpa dict perantara
+                interview_structured = interview_result.output.model_dump_json(indent=2)
                 
                 self.config.memory.set("interview_results", interview_structured)
-                state["shared_memory"]["interview_results"] = interview_structured
+                # State hanya membawa handle; payload penuh cukup ada di config.memory
+                state["shared_memory"]["interview_results"] = DocumentHandle.of(
+                    "interview_results", interview_structured)
                 state["stage_completed"]["interview"] = True
                 state["current_stage"] = "environment"
                 
@@ -544,104 +797,96 @@ class SSLDCOrchestrator:
         
         return state
     
-    def _environment_stage(self, state: WorkflowState) -> WorkflowState:
-        """Environment requirements stage"""
-        console.print("\n[bold]🌍 Creating Environment Requirements[/bold]")
-        
-        environment_agent = create_environment_agent(self.config.model, self.config.memory_tools)
-        
+    async def _requirements_stage(self, state: WorkflowState) -> WorkflowState:
+        """Environment & security requirements stage - keduanya hanya butuh interview results, jadi paralel"""
+        console.print("\n[bold]\U0001F30D\U0001F512 Creating Environment & Security Requirements[/bold]")
+
+        tasks = []
+        if not state["stage_completed"].get("environment", False):
+            tasks.append(self._run_environment_requirements(state))
+        if not state["stage_completed"].get("security", False):
+            tasks.append(self._run_security_requirements(state))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        state["current_stage"] = "design"
+        return state
+
+    async def _run_environment_requirements(self, state: WorkflowState):
+        """Jalankan environment agent dan simpan hasilnya"""
+        environment_agent = self._stage_agent("environment")
+
         try:
-            environment_doc = retry_with_delay_and_confirmation(
-                safe_run_agent,
+            environment_doc = await retry_with_delay_and_confirmation_async(
+                safe_run_agent_async,
                 environment_agent,
                 "Create EnvironmentRequirements document based on interview results.",
                 "Environment Requirements Stage"
             )
-            
+
             if environment_doc is not None:
-                environment_structured = json.dumps(
-                    environment_doc.output.model_dump(),
-                    indent=2,
-                    default=str,
-                    ensure_ascii=False
-                )
-                
+                environment_structured = environment_doc.output.model_dump_json(indent=2)
+
                 self.config.memory.set("environment_requirements", environment_structured)
-                state["shared_memory"]["environment_requirements"] = environment_structured
+                state["shared_memory"]["environment_requirements"] = DocumentHandle.of(
+                    "environment_requirements", environment_structured)
                 save_document_file("Environment_Requirements.json", environment_structured)
-                console.print("\n[bold green]✅ Environment requirements created![/bold green]")
-                
+                console.print("\n[bold green]\u2705 Environment requirements created![/bold green]")
+
             state["stage_completed"]["environment"] = True
-            state["current_stage"] = "security"
-            
+
         except Exception as e:
-            console.print(f"[bold red]❌ Environment stage error:[/bold red] {e}")
+            console.print(f"[bold red]\u274C Environment stage error:[/bold red] {e}")
             state["stage_completed"]["environment"] = True
-            state["current_stage"] = "security"
-        
-        return state
-    
-    def _security_stage(self, state: WorkflowState) -> WorkflowState:
-        """Security requirements stage"""
-        console.print("\n[bold]🔒 Creating Security Requirements[/bold]")
-        
-        security_agent = create_security_requirement_agent(self.config.model, self.config.memory_tools)
-        
+
+    async def _run_security_requirements(self, state: WorkflowState):
+        """Jalankan security agent dan simpan hasilnya"""
+        security_agent = self._stage_agent("security")
+
         try:
-            security_doc = retry_with_delay_and_confirmation(
-                safe_run_agent,
+            security_doc = await retry_with_delay_and_confirmation_async(
+                safe_run_agent_async,
                 security_agent,
                 "Create SecurityRequirements document for this application.",
                 "Security Requirements Stage"
             )
-            
+
             if security_doc is not None:
-                security_structured = json.dumps(
-                    security_doc.output.model_dump(),
-                    indent=2,
-                    default=str,
-                    ensure_ascii=False
-                )
-                
+                security_structured = security_doc.output.model_dump_json(indent=2)
+
                 self.config.memory.set("security_requirements", security_structured)
-                state["shared_memory"]["security_requirements"] = security_structured
+                state["shared_memory"]["security_requirements"] = DocumentHandle.of(
+                    "security_requirements", security_structured)
                 save_document_file("Security_Requirements.json", security_structured)
-                console.print("\n[bold green]✅ Security requirements created![/bold green]")
-                
+                console.print("\n[bold green]\u2705 Security requirements created![/bold green]")
+
             state["stage_completed"]["security"] = True
-            state["current_stage"] = "design"
-            
+
         except Exception as e:
-            console.print(f"[bold red]❌ Security stage error:[/bold red] {e}")
+            console.print(f"[bold red]\u274C Security stage error:[/bold red] {e}")
             state["stage_completed"]["security"] = True
-            state["current_stage"] = "design"
-        
-        return state
-    
-    def _design_stage(self, state: WorkflowState) -> WorkflowState:
+
+    async def _design_stage(self, state: WorkflowState) -> WorkflowState:
         """Design stage"""
         console.print("\n[bold]🎨 Creating System Design[/bold]")
         
-        design_agent = create_design_agent(self.config.model, self.config.memory_tools)
+        design_agent = self._stage_agent("design")
         
         try:
-            design_doc = retry_with_delay_and_confirmation(
-                safe_run_agent,
+            design_doc = await retry_with_delay_and_confirmation_async(
+                safe_run_agent_async,
                 design_agent,
                 "Create SystemDesign document based on all existing documents.",
                 "System Design Stage"
             )
             
             if design_doc is not None:
-                design_structured = json.dumps(
-                    design_doc.output.model_dump(),
-                    indent=2,
-                    default=str,
-                    ensure_ascii=False
-                )
+                design_structured = design_doc.output.model_dump_json(indent=2)
                 
                 self.config.memory.set("system_design", design_structured)
-                state["shared_memory"]["system_design"] = design_structured
+                state["shared_memory"]["system_design"] = DocumentHandle.of(
+                    "system_design", design_structured)
                 save_document_file("System_Design.json", design_structured)
                 console.print("\n[bold green]✅ System design created![/bold green]")
                 
@@ -655,16 +900,17 @@ class SSLDCOrchestrator:
         
         return state
     
-    def _generation_stage(self, state: WorkflowState) -> WorkflowState:
+    async def _generation_stage(self, state: WorkflowState) -> WorkflowState:
         """Code and documentation generation stage"""
         console.print("\n[bold]⚡ Generating Code and Documentation[/bold]")
         
-        generator_agent = create_generator_agent(self.config.model, self.config.memory_tools)
+        generator_agent = self._stage_agent("generator")
         
         try:
-            # Generate documentation and code
-            generation_result = retry_with_delay_and_confirmation(
-                safe_run_agent,
+            # Generate documentation and code. Streaming: ringkasan generator
+            # tampil token-per-token, tidak menunggu seluruh output codegen selesai
+            generation_result = await retry_with_delay_and_confirmation_async(
+                safe_run_agent_stream,
                 generator_agent,
                 "Generate comprehensive documentation with Mermaid diagrams and functional application code based on all available documents",
                 "Generation Stage"
@@ -681,11 +927,7 @@ class SSLDCOrchestrator:
     
     def _workflow_complete(self, state: WorkflowState) -> WorkflowState:
         """Workflow completion"""
-        console.print(Panel(
-            "🎉 App Development Workflow Complete!\n\nAll documents and code have been generated. You can now continue with normal chat.",
-            title="[bold magenta]Workflow Completed[/bold magenta]",
-            style="green"
-        ))
+        console.print(_COMPLETE_PANEL)
         
         state["workflow_active"] = False
         state["current_stage"] = "complete"
@@ -693,44 +935,60 @@ class SSLDCOrchestrator:
         
         return state
     
+    def _handle_help(self, user_input: str, state: WorkflowState, intent_analysis: dict) -> str:
+        """Respons untuk intent 'help'"""
+        return _HELP_TEXT
+
+    def _handle_status(self, user_input: str, state: WorkflowState, intent_analysis: dict) -> str:
+        """Respons untuk intent 'status'"""
+        if state.get("workflow_active", False):
+            current_stage = state.get("current_stage", "unknown")
+            completed = state.get("stage_completed") or _EMPTY_DICT
+            # Generator langsung ke join, tanpa list perantara
+            completed_names = ", ".join(k for k, v in completed.items() if v) or "none"
+            confidence = intent_analysis.get("confidence", 0)
+
+            return (
+                f"Workflow is active. Current stage: {current_stage}.\n"
+                f"Completed stages: {completed_names}\n"
+                f"Intent confidence: {confidence:.2%}"
+            )
+        else:
+            return "No active workflow. Start by telling me what kind of app you want to create!"
+
+    def _handle_app_development(self, user_input: str, state: WorkflowState, intent_analysis: dict) -> str:
+        """Respons untuk intent 'app_development'"""
+        app_type = intent_analysis.get("app_type", "application")
+        confidence = intent_analysis.get("confidence", 0)
+        return (f"I understand you want to develop a {app_type} (confidence: {confidence:.2%}). "
+               f"Let me help you start the development workflow!")
+
+    # Dispatch table intent -> handler: satu lookup hash menggantikan rantai
+    # perbandingan string; branch default tetap di _generate_chat_response
+    _INTENT_HANDLERS = {
+        "help": _handle_help,
+        "status": _handle_status,
+        "app_development": _handle_app_development,
+    }
+
     def _generate_chat_response(self, user_input: str, state: WorkflowState) -> str:
         """Generate response for general chat mode using intent analysis"""
-        intent_analysis = state.get("intent_analysis", {})
+        # Bind sekali: intent_analysis bisa None, dan default {} literal akan
+        # dialokasikan ulang tiap pemanggilan
+        intent_analysis = state.get("intent_analysis") or _EMPTY_DICT
         intent_type = intent_analysis.get("intent_type", "general_chat")
-        
+
         # Use intent information to provide better responses
-        if intent_type == "help":
-            return ("I'm your SSDLC assistant! I can help you with:\n"
-                   "• App development workflow (just say 'make app' or 'create application')\n"
-                   "• General questions about software development\n"
-                   "• Security requirements and best practices\n"
-                   "• System design guidance\n\n"
-                   "To start building an app, just tell me what kind of application you want to create!")
-        
-        elif intent_type == "status":
-            if state.get("workflow_active", False):
-                current_stage = state.get("current_stage", "unknown")
-                completed = state.get("stage_completed", {})
-                completed_stages = [k for k, v in completed.items() if v]
-                confidence = intent_analysis.get("confidence", 0)
-                
-                status_text = f"Workflow is active. Current stage: {current_stage}.\n"
-                status_text += f"Completed stages: {', '.join(completed_stages) if completed_stages else 'none'}\n"
-                status_text += f"Intent confidence: {confidence:.2%}"
-                return status_text
-            else:
-                return "No active workflow. Start by telling me what kind of app you want to create!"
-        
-        elif intent_type == "app_development":
-            app_type = intent_analysis.get("app_type", "application")
-            confidence = intent_analysis.get("confidence", 0)
-            return (f"I understand you want to develop a {app_type} (confidence: {confidence:.2%}). "
-                   f"Let me help you start the development workflow!")
-        
+        handler = self._INTENT_HANDLERS.get(intent_type)
+        if handler is not None:
+            return handler(self, user_input, state, intent_analysis)
+
         # Greeting responses (fallback check)
         user_input_lower = user_input.lower()
-        if any(word in user_input_lower for word in ["hi", "hello", "hey", "good morning", "good afternoon"]):
-            return "Hello! I'm here to help you with secure software development. What would you like to work on today?"
+        if (not _GREETING_WORDS.isdisjoint(user_input_lower.split())
+                or _GREETING_PHRASES[0] in user_input_lower
+                or _GREETING_PHRASES[1] in user_input_lower):
+            return _GREETING_REPLY
         
         # Default response with intent information
         reasoning = intent_analysis.get("reasoning", "No specific intent detected")
@@ -738,24 +996,35 @@ class SSLDCOrchestrator:
                f"If you'd like to create an application, just let me know what kind of app you want to build "
                f"and I'll guide you through the process!")
     
-    def run_chat(self):
-        """Run the interactive chat interface"""
-        console.print(Panel(
-            "🤖 SSDLC Agentic Orchestrator with AI Intent Understanding\n\n"
-            "I use advanced AI agents to understand your intent and guide you!\n"
-            "• To create an app: describe what you want to build in natural language\n"
-            "• For general chat: ask me anything about software development\n"
-            "• For help: ask 'what can you do?' or 'help'\n"
-            "• Type 'exit' to quit\n\n"
-            "💡 I'll intelligently analyze your messages to provide the best assistance!",
-            title="[bold magenta]Welcome to AI-Powered SSDLC[/bold magenta]",
-            style="cyan"
-        ))
+    async def run_batch(self, inputs: List[str]) -> List[WorkflowState]:
+        """
+        Proses beberapa input user sekaligus lewat ainvoke paralel.
+        Catatan: semua invocation berbagi Memory dan file dokumen yang sama,
+        jadi batch ini cocok untuk input se-tahap (mis. klasifikasi intent
+        massal), bukan beberapa proyek penuh sekaligus.
+        """
+        states = [
+            {
+                "messages": deque(maxlen=_MAX_MESSAGES),
+                "current_stage": "",
+                "workflow_active": False,
+                "user_input": user_input,
+                "shared_memory": {},
+                "stage_completed": {},
+                "last_agent_response": None,
+                "intent_analysis": None
+            }
+            for user_input in inputs
+        ]
+        return await asyncio.gather(*(self.workflow.ainvoke(state) for state in states))
+
+    async def run_chat_async(self):
+        """Run the interactive chat interface (async)"""
+        console.print(_WELCOME_PANEL)
         
         # Initialize state
-        config = {"configurable": {"thread_id": "ssdlc_chat"}}
         initial_state = {
-            "messages": [],
+            "messages": deque(maxlen=_MAX_MESSAGES),
             "current_stage": "",
             "workflow_active": False,
             "user_input": "",
@@ -773,36 +1042,36 @@ class SSLDCOrchestrator:
                 if not user_input:
                     continue
                     
-                if user_input.lower() in ['exit', 'quit', 'bye']:
+                if len(user_input) <= 4 and user_input.lower() in _EXIT_CMDS:
                     console.print("[bold yellow]👋 Goodbye![/bold yellow]")
                     break
                 
-                # Update state with user input
-                current_state = initial_state.copy()
-                current_state["user_input"] = user_input
-                
-                # Run workflow
-                result = self.workflow.invoke(current_state, config)
-                
+                # Update state with user input; mutasi langsung, tanpa copy dict
+                # per turn (hasil ainvoke langsung menggantikan state lama)
+                initial_state["user_input"] = user_input
+
+                # Run workflow (node async dieksekusi lewat ainvoke)
+                result = await self.workflow.ainvoke(initial_state)
+
                 # Update initial state for next iteration
                 initial_state = result
                 
                 # Show assistant response if available
                 if result.get("last_agent_response"):
-                    console.print(f"[bold cyan]🤖 Assistant:[/bold cyan] {result['last_agent_response']}")
+                    console.print(_ASSISTANT_PREFIX, result["last_agent_response"])
                 
             except KeyboardInterrupt:
                 console.print("\n[bold yellow]👋 Chat interrupted. Goodbye![/bold yellow]")
                 break
             except Exception as e:
-                console.print(f"[bold red]❌ Error:[/bold red] {e}")
+                console.print(_ERROR_PREFIX, str(e))
                 continue
 
 def main():
     """Main function to start the orchestrator"""
     try:
         orchestrator = SSLDCOrchestrator()
-        orchestrator.run_chat()
+        asyncio.run(orchestrator.run_chat_async())
     except KeyboardInterrupt:
         console.print("\n[bold yellow]👋 Goodbye![/bold yellow]")
     except Exception as e:
@@ -0,0 +1,203 @@
+"""
+Async SSDLC Pipeline Runner
+Runs the full agent pipeline (interview -> environment/security -> misuse cases
+-> design -> architecture -> threat model) on native asyncio so that stages
+without dependencies on each other can overlap their Gemini API latency.
+"""
+import asyncio
+import os
+
+from agents.interview_agent import create_interview_agent
+from agents.environment_agent import create_environment_agent
+from agents.security_agent import create_security_requirement_agent
+from agents.misuse_case_agent import create_misuse_case_agent
+from agents.design_agent import create_design_agent
+from agents.architecture_agent import create_architecture_agent
+from agents.threat_model_agent import create_threat_model_agent
+
+from agents.utils import (
+    setup_model, Memory, create_memory_tools,
+    save_document_file, safe_run_agent_async,
+    retry_with_delay_and_confirmation_async,
+    build_context, json_dumps, console
+)
+
+
+async def run_stage(agent, prompt, step_name, memory, memory_key, filename, context_keys=None):
+    """Jalankan satu tahap pipeline secara async, simpan hasilnya ke memori dan file."""
+    if context_keys:
+        # Suntikkan dokumen dependensi langsung ke prompt, hemat roundtrip tool per dokumen
+        context = build_context(memory, context_keys)
+        if context:
+            prompt = f"{prompt}\n\nDokumen konteks yang sudah tersedia:\n{context}"
+
+    result = await retry_with_delay_and_confirmation_async(
+        safe_run_agent_async,
+        agent,
+        prompt,
+        step_name
+    )
+
+    if result is None:
+        console.print(f"[bold yellow]⚠️ {step_name} dilewati, lanjut ke tahap berikutnya...[/bold yellow]")
+        return None
+
+    structured = json_dumps(result.output.model_dump())
+    memory.set(memory_key, structured)
+    save_document_file(filename, structured)
+    console.print(f"\n[bold green]✅ {step_name} selesai![/bold green]")
+    return structured
+
+
+async def main_async(initial_prompt: str = "Saya ingin membuat aplikasi baru.",
+                     model=None, output_dir: str = "."):
+    """
+    Entry point async untuk pipeline SSDLC penuh.
+
+    Dependency DAG:
+    - interview adalah akar dari semua tahap
+    - environment dan security hanya bergantung pada interview -> dijalankan paralel
+    - misuse cases bergantung pada security
+    - design bergantung pada interview, environment, security, dan misuse cases
+    - architecture bergantung pada design, threat model bergantung pada keduanya
+
+    Args:
+        initial_prompt: Prompt awal untuk tahap interview
+        model: Model AI yang dipakai (default: singleton dari setup_model)
+        output_dir: Direktori tujuan file dokumen (default: direktori kerja).
+            Wajib berbeda per proyek saat beberapa pipeline berjalan paralel,
+            karena nama file dokumennya sama.
+    """
+    if model is None:
+        model = setup_model()
+    if output_dir != ".":
+        os.makedirs(output_dir, exist_ok=True)
+
+    def doc_path(filename):
+        return os.path.join(output_dir, filename)
+
+    memory = Memory()
+    memory_tools = create_memory_tools(memory)
+
+    # Tahap 1: Interview (akar dependency)
+    console.print("\n[bold]🎤 Interview Stage[/bold]")
+    await run_stage(
+        create_interview_agent(model),
+        initial_prompt,
+        "Interview Stage",
+        memory, "interview_results", doc_path("Interview_Results.json")
+    )
+
+    # Tahap 2: Environment dan Security hanya butuh interview_results -> paralel
+    console.print("\n[bold]🌍🔒 Environment & Security Requirements (paralel)[/bold]")
+    await asyncio.gather(
+        run_stage(
+            create_environment_agent(model, memory_tools),
+            "Create EnvironmentRequirements document based on interview results.",
+            "Environment Requirements Stage",
+            memory, "environment_requirements", doc_path("Environment_Requirements.json"),
+            context_keys=["interview_results"]
+        ),
+        run_stage(
+            create_security_requirement_agent(model, memory_tools),
+            "Create SecurityRequirements document for this application.",
+            "Security Requirements Stage",
+            memory, "security_requirements", doc_path("Security_Requirements.json"),
+            context_keys=["interview_results"]
+        )
+    )
+
+    # Tahap 3: Misuse cases bergantung pada security requirements
+    console.print("\n[bold]😈 Misuse Cases[/bold]")
+    await run_stage(
+        create_misuse_case_agent(model, memory_tools),
+        "Create MisuseCases document based on the security requirements.",
+        "Misuse Case Stage",
+        memory, "misuse_cases", doc_path("Misuse_Cases.json"),
+        context_keys=["security_requirements"]
+    )
+
+    # Tahap 4: Design menggabungkan semua dokumen sebelumnya
+    console.print("\n[bold]🎨 System Design[/bold]")
+    await run_stage(
+        create_design_agent(model, memory_tools),
+        "Create SystemDesign document based on all existing documents.",
+        "System Design Stage",
+        memory, "system_design", doc_path("System_Design.json"),
+        context_keys=["interview_results", "environment_requirements",
+                      "security_requirements", "misuse_cases"]
+    )
+
+    # Tahap 5: Architecture lalu threat model
+    console.print("\n[bold]🏛️ System Architecture[/bold]")
+    await run_stage(
+        create_architecture_agent(model, memory_tools),
+        "Create SystemArchitecture document based on the system design.",
+        "System Architecture Stage",
+        memory, "system_architecture", doc_path("System_Architecture.json"),
+        context_keys=["system_design"]
+    )
+
+    console.print("\n[bold]⚔️ Threat Model[/bold]")
+    await run_stage(
+        create_threat_model_agent(model, memory_tools),
+        "Create ThreatModel document based on the system design and architecture.",
+        "Threat Model Stage",
+        memory, "threat_model", doc_path("Threat_Model.json"),
+        context_keys=["system_design", "system_architecture"]
+    )
+
+    console.print("\n[bold magenta]🎉 Pipeline SSDLC selesai! Semua dokumen telah dibuat.[/bold magenta]")
+    return memory
+
+
+async def run_batch_async(project_prompts, max_concurrency: int = 16,
+                          output_dir_template: str = "project_{index}"):
+    """
+    Jalankan pipeline untuk banyak proyek sekaligus dengan concurrency terbatas.
+    Setiap proyek menulis dokumennya ke direktori sendiri (dari
+    output_dir_template), karena nama file dokumen tiap pipeline sama dan
+    akan saling menimpa jika ditulis ke satu direktori.
+
+    Args:
+        project_prompts: List prompt awal, satu per proyek
+        max_concurrency: Maksimal pipeline yang berjalan bersamaan (default: 16)
+        output_dir_template: Template direktori output per proyek; placeholder
+            {index} diisi nomor proyek mulai dari 1 (default: "project_{index}")
+
+    Returns:
+        List hasil per proyek (Memory jika sukses, Exception jika gagal).
+    """
+    model = setup_model()
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(index, prompt):
+        async with sem:
+            return await main_async(
+                prompt, model=model,
+                output_dir=output_dir_template.format(index=index)
+            )
+
+    results = await asyncio.gather(
+        *[_one(i + 1, prompt) for i, prompt in enumerate(project_prompts)],
+        return_exceptions=True
+    )
+
+    failed = sum(1 for r in results if isinstance(r, Exception))
+    console.print(
+        f"\n[bold magenta]Batch selesai:[/bold magenta] "
+        f"{len(results) - failed} sukses, {failed} gagal dari {len(results)} proyek."
+    )
+    return results
+
+
+def main():
+    """Main function untuk menjalankan pipeline dari command line."""
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        console.print("\n[bold yellow]👋 Pipeline dihentikan.[/bold yellow]")
+
+
+if __name__ == "__main__":
+    main()